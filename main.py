@@ -3,10 +3,13 @@ import json
 import logging
 import logging.config
 import os
+import shutil
+import sys
 from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
-from typing import Self
+from typing import Iterable, Self
 
 from dotenv import find_dotenv, load_dotenv
 
@@ -71,21 +74,37 @@ class Main:
                     else:
                         self.logger.info(f"Skipped renaming {original}")
 
-        csv = self.generate_csv(records)
+        records = self.merge_records(records)
 
         if self.args.write:
             self.logger.info("Writing records to file")
-            (self.args.source_dir / "records.csv").write_text(csv)
+            self.write_records(records)
             self.logger.info(f"Wrote records to {self.args.source_dir / 'records.csv'}")
         else:
             self.logger.info("Records:")
             print()
-            print(csv)
+            Record.write_csv(records, sys.stdout)
+            print()
 
-    def generate_csv(self, records: list[Record]) -> str:
-        final = self.scanner.known_records.copy()
-        final.update({record.filename: record for record in records})
-        return Record.generate_csv(final.values())
+    def merge_records(self, records: list[Record]) -> Iterable[Record]:
+        known = self.scanner.known_records.values()
+        final = {record.filename: record for record in chain(known, records)}
+        return final.values()
+
+    def write_records(self, records: Iterable[Record]):
+        """Write records.csv via a temp file so a failure leaves the old file intact"""
+        path = (self.args.source_dir / "records.csv").resolve()
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+        try:
+            with tmp.open("w", buffering=1 << 17) as f:
+                Record.write_csv(records, f)
+            if path.exists():
+                shutil.copymode(path, tmp)
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
 
     @classmethod
     def get_api_key(cls) -> str:
@@ -1,15 +1,35 @@
-import aiofiles
+import aiohttp
 import asyncio
-import json
+import orjson
 from pathlib import Path
-from typing import Iterable
+from typing import BinaryIO, Iterable
 
-import grequests
 from datetime import date as pydate
 from dateutil.parser import parse as date_parse
 
 from .record import Record
 
+UNKNOWN_DATE = pydate.fromisoformat("0001-01-01")
+
+
+def parse_date(value: str) -> pydate:
+    """Parse a Taggun date, trying the ISO-8601 prefix before falling back to dateutil."""
+    try:
+        return pydate.fromisoformat(value[:10])
+    except ValueError:
+        pass
+
+    try:
+        return date_parse(value).date()
+    except (ValueError, OverflowError):
+        return UNKNOWN_DATE
+
+
+def response_data(response: dict, key: str, default):
+    """Return response[key]["data"], or the default if either level is missing or not a dict."""
+    field = response.get(key) if isinstance(response, dict) else None
+    return field.get("data", default) if isinstance(field, dict) else default
+
 
 class Client:
     """Hit taggun's API to process receipt images into records."""
@@ -24,8 +44,9 @@ class Client:
         "language": "en",
     }
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, concurrency: int = 32):
         self.api_key = api_key
+        self.concurrency = concurrency
 
     @property
     def headers(self) -> dict:
@@ -34,60 +55,55 @@ class Client:
     def run(self, source_dir: Path, records: list[Record]) -> Iterable[Record]:
         return asyncio.run(self.run_async(source_dir, records))
 
-    async def run_async(self, source_dir: Path, records: Record):
-        tasks = [self.gen_requests(source_dir, record) for record in records]
-        completed = await asyncio.gather(*tasks)
-
-        reqs = []
-        for args in completed:
-            reqs.append(grequests.post(self.url, **args))
-
-        map = list(zip(reqs, records))
-
-        results = []
-
-        for idx, response in grequests.imap_enumerated(reqs, size=10):
-            if not response:
-                print(f"Failed to process {map[idx][1].filename}")
-            else:
-                results.append(self.process_response(json.loads(response.text), map[idx][1]))
-
-        return results
-
-    async def gen_requests(self, source_dir: Path, record: Record) -> dict:
-        async with aiofiles.open(source_dir / record.filename, "rb") as f:
-            content = await f.read()
-
-        return {
-            "files": {"file": (record.filename, content, f"image/{record.filetype}")},
-            "data": self.payload,
-            "headers": self.headers,
-        }
+    async def run_async(self, source_dir: Path, records: list[Record]) -> list[Record]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        connector = aiohttp.TCPConnector(limit=self.concurrency, keepalive_timeout=60)
+
+        async with aiohttp.ClientSession(connector=connector, headers=self.headers) as session:
+            tasks = [self.post(session, semaphore, source_dir, record) for record in records]
+            results = await asyncio.gather(*tasks)
+
+        return [record for record in results if record is not None]
+
+    async def post(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        source_dir: Path,
+        record: Record,
+    ) -> Record | None:
+        async with semaphore:
+            try:
+                with (source_dir / record.filename).open("rb") as f:
+                    data = self.gen_form(record, f)
+
+                    async with session.post(self.url, data=data) as response:
+                        response.raise_for_status()
+                        content = orjson.loads(await response.read())
+
+                return self.process_response(content, record)
+            except (OSError, aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError):
+                print(f"Failed to process {record.filename}")
+                return None
+
+    def gen_form(self, record: Record, file: BinaryIO) -> aiohttp.FormData:
+        form = aiohttp.FormData(self.payload)
+        form.add_field(
+            "file", file, filename=record.filename, content_type=f"image/{record.filetype}"
+        )
+        return form
 
     def process_response(self, response: dict, record: Record) -> Record:
-        try:
-            tax_amount = response["taxAmount"]["data"]
-        except:
-            tax_amount = float("nan")
+        tax_amount = response_data(response, "taxAmount", float("nan"))
+        total_amount = response_data(response, "totalAmount", float("nan"))
+        merchant_name = response_data(response, "merchantName", "Unknown")
 
-        try:
-            total_amount = response["totalAmount"]["data"]
-        except:
-            total_amount = float("nan")
-
-        try:
-            merchant_name = response["merchantName"]["data"]
-        except:
-            merchant_name = "Unknown"
-
-        try:
-            date = date_parse(response["date"]["data"]).date()
-        except:
-            date = pydate.fromisoformat("0001-01-01")
+        date = response_data(response, "date", None)
+        date = parse_date(date) if isinstance(date, str) else UNKNOWN_DATE
 
         try:
             confidence = round(float(response["confidenceLevel"]), 2)
-        except:
+        except (KeyError, TypeError, ValueError, OverflowError):
             confidence = 0.0
 
         record.date = date
@@ -1,4 +1,5 @@
 from enum import StrEnum
+from typing import Self
 
 
 class FileType(StrEnum):
@@ -17,5 +18,12 @@ class FileType(StrEnum):
 
         return FileType.UNKNOWN
 
+    @classmethod
+    def from_suffix(cls, suffix: str) -> Self:
+        return SUFFIXES.get(suffix.lower(), FileType.UNKNOWN)
+
     def suffix(self) -> str:
         return f".{self}"
+
+
+SUFFIXES = {filetype.value: filetype for filetype in FileType} | {"jpeg": FileType.JPG}
@@ -1,14 +1,30 @@
+import csv
 from dataclasses import dataclass
 from datetime import date as pydate
-import uuid
+from functools import lru_cache
+import io
+import secrets
+import sys
 from .enum import FileType
-from typing import Iterable, Self
+from typing import Iterable, Self, TextIO
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def format_short_date(date: pydate) -> str:
+    return f"{date.month:02d}{date.day:02d}{date.year}"
+
+
+@lru_cache(maxsize=4096)
+def format_short_name(name: str) -> str:
+    return name.strip().replace(" ", "").lower()
+
+
+@dataclass(slots=True)
 class Record:
     """A transaction record"""
 
+    HEADER = "date,name,total,tax,confidence,filename"
+
     filename: str
     filetype: FileType = None
     date: pydate = None
@@ -18,10 +34,10 @@ class Record:
     confidence: float = None
 
     def short_date(self) -> str:
-        return self.date.strftime("%m%d%Y")
+        return format_short_date(self.date)
 
     def short_name(self) -> str:
-        return self.name.strip().replace(" ", "").lower()
+        return format_short_name(self.name)
 
     def needs_new_filename(self, confidence: float) -> bool:
         if self.confidence < confidence:
@@ -32,15 +48,13 @@ class Record:
             return True
 
         date, name, _ = parts
-        if not (date == self.short_date() and name == self.short_name()):
-            return True
-
-        return False
+        return date != self.short_date() or name != self.short_name()
 
     def generate_new_filename(self, confidence: float) -> bool:
         new = self.needs_new_filename(confidence)
         if new:
-            self.filename = f"{self.short_date()}_{self.short_name()}_{uuid.uuid4().hex[:8]}{self.filetype.suffix()}"
+            nonce = secrets.token_hex(4)
+            self.filename = f"{self.short_date()}_{self.short_name()}_{nonce}{self.filetype.suffix()}"
 
         return new
 
@@ -48,42 +62,50 @@ class Record:
         return f"({self.name}, {self.total}, {self.confidence}, {self.filename})"
 
     def __str__(self) -> str:
-        return ",".join(
-            [
-                str(self.date),
-                str(self.name),
-                str(self.total),
-                str(self.tax),
-                str(self.confidence),
-                self.filename,
-            ]
-        )
+        return f"{self.date},{self.name},{self.total},{self.tax},{self.confidence},{self.filename}"
 
     @classmethod
     def header(cls) -> str:
-        return ",".join(["date", "name", "total", "tax", "confidence", "filename"])
+        return cls.HEADER
+
+    @classmethod
+    def generate_csv(cls, records: Iterable[Self]) -> str:
+        buffer = io.StringIO()
+        cls.write_csv(records, buffer)
+        return buffer.getvalue()
 
     @classmethod
-    def generate_csv(self, records: Iterable[Self]) -> str:
-        header = self.header()
+    def write_csv(cls, records: Iterable[Self], stream: TextIO):
+        """Write the records as CSV to a text stream, one row at a time"""
+        stream.write(cls.HEADER)
         records = sorted(records, key=lambda r: r.short_name())
-        return header + "\n" + "\n".join([str(record) for record in records])
+        stream.writelines(f"\n{record!s}" for record in records)
 
     @classmethod
-    def parse_csv(cls, csv: str) -> dict[str, Self]:
-        lines = csv.strip().split("\n")
-        if lines[0] != cls.header():
+    def parse_csv(cls, text: str) -> dict[str, Self]:
+        return cls.read_csv(io.StringIO(text))
+
+    @classmethod
+    def read_csv(cls, stream: TextIO) -> dict[str, Self]:
+        """Parse records from a text stream, one row at a time"""
+        reader = csv.reader((line.strip() for line in stream), quoting=csv.QUOTE_NONE)
+        rows = (row for row in reader if row)
+        if next(rows, None) != cls.HEADER.split(","):
             raise ValueError("Invalid CSV header")
 
-        records = [cls.from_csv(line) for line in lines[1:] if line.strip() != ""]
+        records = (cls.from_csv_row(row) for row in rows)
         return {record.filename: record for record in records}
 
     @classmethod
     def from_csv(cls, line: str):
-        date, name, total, tax, confidence, filename = line.strip().split(",")
+        return cls.from_csv_row(line.strip().split(","))
+
+    @classmethod
+    def from_csv_row(cls, row: list[str]):
+        date, name, total, tax, confidence, filename = row
         return cls(
-            filename,
-            FileType(filename.split(".")[-1]),
+            sys.intern(filename),
+            FileType.from_suffix(filename.rpartition(".")[2]),
             pydate.fromisoformat(date),
             name,
             float(total),
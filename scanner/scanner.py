@@ -1,10 +1,21 @@
 import logging
+import os
+import sys
 from pathlib import Path
 from typing import Iterable
 
 from .enum import FileType
 from .record import Record
 
+MAGIC_NUMBERS = {
+    b"\x89PNG\r\n\x1a\n": FileType.PNG,
+    b"\xff\xd8\xff": FileType.JPG,
+    b"GIF87a": FileType.GIF,
+    b"GIF89a": FileType.GIF,
+    b"%PDF-": FileType.PDF,
+}
+MAGIC_LENGTHS = sorted({len(magic) for magic in MAGIC_NUMBERS}, reverse=True)
+
 
 class Scanner:
     """Reads image file metadata in the source directory."""
@@ -15,13 +26,24 @@ class Scanner:
         self.logger = logging.getLogger()
         self.records_path = source_dir / "records.csv"
         self.__known_records: dict[str, Record] = {}
+        self.__known_records_mtime: int = None
 
     @property
     def known_records(self) -> dict[str, Record]:
-        if not self.__known_records:
-            if self.records_path.exists():
-                with self.records_path.open() as f:
-                    self.__known_records = Record.parse_csv(f.read())
+        """Records from records.csv, reparsed only when the file's mtime changes."""
+        try:
+            mtime = self.records_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+
+        if mtime != self.__known_records_mtime:
+            if mtime is None:
+                self.__known_records = {}
+            else:
+                with self.records_path.open(newline="") as f:
+                    self.__known_records = Record.read_csv(f)
+
+            self.__known_records_mtime = mtime
 
         return self.__known_records
 
@@ -32,58 +54,60 @@ class Scanner:
             dict[str, Record]: A dictionary of records keyed by filename
         """
         self.logger.info(f"Loading images from {self.source_dir}")
+        known_records = self.known_records
 
-        for file in self.source_dir.iterdir():
-            logline = f"{file}... "
+        with os.scandir(self.source_dir) as entries:
+            for entry in entries:
+                name = sys.intern(entry.name)
+                logline = f"{entry.path}... "
 
-            if not file.is_file():
-                logline += "not a file, skipping"
-                self.logger.info(logline)
-                continue
-
-            filetype = self.guess_file_type(file)
-            if filetype == FileType.CSV:
-                continue
+                if not entry.is_file():
+                    logline += "not a file, skipping"
+                    self.logger.info(logline)
+                    continue
 
-            if filetype == FileType.UNKNOWN:
-                logline += "unknown file type, skipping"
-                self.logger.info(logline)
-                continue
+                filetype = self.guess_file_type(entry)
+                if filetype == FileType.CSV:
+                    continue
 
-            if known := self.known_records.get(file.name):
-                if known.confidence >= self.confidence:
-                    logline += f"known record with high confidence ({known.confidence}), skipping"
+                if filetype == FileType.UNKNOWN:
+                    logline += "unknown file type, skipping"
                     self.logger.info(logline)
                     continue
+
+                if known := known_records.get(name):
+                    if known.confidence >= self.confidence:
+                        logline += f"known record with high confidence ({known.confidence}), skipping"
+                        self.logger.info(logline)
+                        continue
+                    else:
+                        logline += f"known record with low confidence ({known.confidence}), processing"
+                        self.logger.info(logline)
+                        yield known
                 else:
-                    logline += f"known record with low confidence ({known.confidence}), processing"
                     self.logger.info(logline)
-                    yield known
-            else:
-                self.logger.info(logline)
-                yield Record(file.name, filetype)
+                    yield Record(name, filetype)
 
-    def guess_file_type(self, file: Path) -> FileType:
-        filetype = FileType(file.suffix[1:])
+    def guess_file_type(self, file: Path | os.DirEntry) -> FileType:
+        filetype = FileType.from_suffix(os.path.splitext(file.name)[1][1:])
 
         if filetype == FileType.UNKNOWN:
-            with file.open("rb") as f:
-                header = f.read(16)
-                filetype = self.read_magic_number(header)
-                f.seek(0)
+            fd = os.open(file, os.O_RDONLY)
+            try:
+                header = os.read(fd, 16)
+            finally:
+                os.close(fd)
+
+            filetype = self.read_magic_number(header)
 
         return filetype
 
     def read_magic_number(self, header: bytes) -> FileType:
-        if header.startswith(b"\x89PNG\r\n\x1a\n"):
-            return FileType.PNG
-        elif header.startswith(b"\xff\xd8\xff"):
-            return FileType.JPG
-        elif header.startswith(b"GIF87a") or header.startswith(b"GIF89a"):
-            return FileType.GIF
-        elif header.startswith(b"%PDF-"):
-            return FileType.PDF
-        elif header[4:12] == b"ftypheic":
+        for length in MAGIC_LENGTHS:
+            if filetype := MAGIC_NUMBERS.get(header[:length]):
+                return filetype
+
+        if header[4:12] == b"ftypheic":
             return FileType.HEIC
-        else:
-            return FileType.UNKNOWN
+
+        return FileType.UNKNOWN